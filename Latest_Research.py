@@ -1,47 +1,140 @@
-from collections import defaultdict, Counter
+import argparse
+import functools
+import re
 import time
 import random
 import os # Import the os module for path manipulation
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+def _maybe_njit(func):
+    """
+    Applies numba's njit when it is installed; otherwise returns func unchanged.
+
+    cache=True persists each compiled kernel to __pycache__, so only the very
+    first run of the script pays JIT latency; later invocations (and every
+    run_instances worker process) load the machine code from disk. That
+    matters here because the script solves many tiny instances per run.
+    """
+    if NUMBA_AVAILABLE:
+        return njit(cache=True)(func)
+    return func
 
 start = time.time()
 
+# numpy >= 2.0 exposes the hardware POPCNT instruction as a ufunc; fall back
+# to a lookup table mapping every 16-bit value to its popcount on older numpy.
+_HAVE_BITWISE_COUNT = hasattr(np, 'bitwise_count')
+if not _HAVE_BITWISE_COUNT:
+    _POPCOUNT16 = np.array([bin(i).count("1") for i in range(1 << 16)], dtype=np.uint8)
+
+# WalkSAT-style parameters for the second pass: probability of taking a random
+# walk flip instead of the greedy one, and how many times to restart from a
+# fresh random assignment after the search stalls.
+NOISE_PROBABILITY = 0.3
+NUM_RESTARTS = 5
+
+def _parse_dimacs_impl(file_path):
+    """
+    Does the actual DIMACS parsing work; see parse_dimacs for the contract.
+    """
+    try:
+        with open(file_path, 'rb') as file:
+            data = file.read()
+
+        # Header first, then strip every comment/header/footer line in one
+        # regex pass so the remainder is nothing but literal tokens.
+        header = re.search(rb'^p\s+cnf\s+(\d+)\s+(\d+)', data, re.MULTILINE)
+        num_variables = int(header.group(1)) if header else 0
+        body = re.sub(rb'(?m)^\s*[cp%].*$', b'', data)
+
+        # Bulk tokenization: one C-level conversion of the whole literal
+        # stream instead of a Python int() call per token.
+        tokens = np.array(body.split(), dtype=np.int32)
+    except FileNotFoundError:
+        # print(f"Error: File not found at {file_path}") # Suppress this for automated testing
+        return 0, np.empty((0, 3), dtype=np.int16)
+    except Exception as e:
+        # print(f"Error parsing DIMACS file {file_path}: {e}") # Suppress this for automated testing
+        return 0, np.empty((0, 3), dtype=np.int16)
+
+    # Clauses are the runs between the 0 terminators; empty runs (e.g. the
+    # lone trailing 0 some SATLIB files carry) are dropped.
+    terminator_positions = np.flatnonzero(tokens == 0)
+    if terminator_positions.size == 0:
+        return num_variables, np.empty((0, 3), dtype=np.int16)
+    clause_starts = np.concatenate(([0], terminator_positions[:-1] + 1))
+    clause_lengths = terminator_positions - clause_starts
+    nonempty = clause_lengths > 0
+    clause_starts = clause_starts[nonempty]
+    clause_lengths = clause_lengths[nonempty]
+    if clause_starts.size == 0:
+        return num_variables, np.empty((0, 3), dtype=np.int16)
+
+    # One contiguous row per clause (uniformly length 3 for strict 3-SAT);
+    # int16 covers the benchmark variable ranges at a quarter of int64's footprint.
+    width = int(clause_lengths.max())
+    dtype = np.int16 if num_variables < (1 << 15) else np.int32
+    if (clause_lengths == width).all():
+        # Uniform clause length: dropping the terminators leaves exactly the
+        # literal matrix, reshaped without any per-clause Python loop.
+        literals = tokens[:terminator_positions[-1] + 1]
+        clauses = literals[literals != 0].reshape(-1, width).astype(dtype)
+    else:
+        clauses = np.zeros((clause_starts.size, width), dtype=dtype)
+        for i in range(clause_starts.size):
+            start = clause_starts[i]
+            clauses[i, :clause_lengths[i]] = tokens[start:start + clause_lengths[i]]
+    return num_variables, clauses
+
+@functools.lru_cache(maxsize=32)
+def _parse_dimacs_cached(file_path, mtime):
+    """
+    Memoized layer over _parse_dimacs_impl, keyed by (path, mtime).
+
+    mtime is part of the key so editing a file on disk invalidates its entry.
+    The clause array is marked read-only because every cache hit hands out
+    the same object; the solver only ever reads it.
+    """
+    num_variables, clauses = _parse_dimacs_impl(file_path)
+    clauses.setflags(write=False)
+    return num_variables, clauses
+
 def parse_dimacs(file_path):
     """
     Parses a DIMACS CNF file to extract the number of variables and clauses.
 
+    Results are cached per (path, modification time), so repeated calls on
+    the same unchanged file (e.g. several solve_3sat runs in a debugging
+    session) only hit the disk once. The returned clause array is shared
+    between those calls and is read-only.
+
     Args:
         file_path (str): The path to the DIMACS CNF file.
 
     Returns:
         tuple: A tuple containing (num_variables, clauses), where
                num_variables (int): The total number of variables in the problem.
-               clauses (list of lists): A list where each inner list represents a clause,
-                                       containing integer literals (positive for true, negative for false).
+               clauses (numpy.ndarray): An int16 array (int32 once the variable
+                                        count no longer fits in int16) of shape
+                                        (num_clauses, max_clause_length) where each row holds one
+                                        clause's integer literals (positive for true, negative for
+                                        false), padded with 0 for clauses shorter than the widest.
     """
-    clauses = []
-    num_variables = 0
     try:
-        with open(file_path, 'r') as file:
-            for line in file:
-                line = line.strip()
-                if not line or line.startswith('c') or line.startswith('%'):
-                    continue
-                if line.startswith('p cnf'):
-                    parts = line.split()
-                    num_variables = int(parts[2])
-                    # num_clauses = int(parts[3]) # Number of clauses is inferred from list length
-                    continue
-                # Clause lines end with '0', so we split and remove the last element
-                clause = list(map(int, line.split()))[:-1]
-                if clause: # Ensure the clause is not empty after removing '0'
-                    clauses.append(clause)
-    except FileNotFoundError:
-        # print(f"Error: File not found at {file_path}") # Suppress this for automated testing
-        return 0, []
-    except Exception as e:
-        # print(f"Error parsing DIMACS file {file_path}: {e}") # Suppress this for automated testing
-        return 0, []
-    return num_variables, clauses
+        mtime = os.path.getmtime(file_path)
+    except OSError:
+        # Missing file: the same silent empty result the parser itself
+        # produces, without burning a cache slot on it.
+        return 0, np.empty((0, 3), dtype=np.int16)
+    return _parse_dimacs_cached(file_path, mtime)
 
 def is_clause_satisfied(clause, assignment):
     """
@@ -56,57 +149,475 @@ def is_clause_satisfied(clause, assignment):
         bool: True if the clause is satisfied, False otherwise.
     """
     for literal in clause:
+        if literal == 0: # Padding in the clause array, not a real literal
+            continue
         var = abs(literal)
         if var in assignment:
-            # Check if the literal (positive or negative) evaluates to true
-            if (literal > 0 and assignment[var]) or \
-               (literal < 0 and not assignment[var]):
+            # The literal is true iff the variable's value differs from the
+            # literal's sign bit: one XOR instead of a branchy and/or chain.
+            if bool(assignment[var]) ^ (literal < 0):
                 return True
     return False
 
-def count_satisfied_clauses(clauses, assignment):
+def build_clause_masks(clauses, num_variables):
+    """
+    Encodes every clause as a pair of bitmasks over the variables.
+
+    Bit (v - 1) of a clause's positive mask is set when the clause contains the
+    literal +v, and the same bit of its negative mask is set for -v. Variables
+    beyond 64 spill into additional 64-bit words, so the representation works
+    for uf20 (one word) up to arbitrarily large instances.
+
+    Args:
+        clauses (numpy.ndarray): Padded clause rows from parse_dimacs, one
+                                 clause per row with 0 filling unused slots.
+        num_variables (int): The total number of variables in the problem.
+
+    Returns:
+        tuple: (pos_mask, neg_mask), two numpy uint64 arrays of shape
+               (num_clauses, num_words).
+    """
+    max_var = num_variables
+    if len(clauses):
+        max_var = max(max_var, int(np.abs(clauses).max()))
+    num_words = max(1, (max_var + 63) // 64)
+
+    pos_mask = np.zeros((len(clauses), num_words), dtype=np.uint64)
+    neg_mask = np.zeros((len(clauses), num_words), dtype=np.uint64)
+    for i, clause in enumerate(clauses):
+        for literal in clause:
+            if literal == 0:
+                continue
+            word, bit = divmod(int(abs(literal)) - 1, 64)
+            if literal > 0:
+                pos_mask[i, word] |= np.uint64(1 << bit)
+            else:
+                neg_mask[i, word] |= np.uint64(1 << bit)
+    return pos_mask, neg_mask
+
+def assignment_to_bits(assignment_values, num_words):
+    """
+    Packs a flat 0/1 assignment array into a bitset of 64-bit words.
+
+    Args:
+        assignment_values (numpy.ndarray): uint8 truth values indexed by
+                                           variable id (entry 0 unused).
+        num_words (int): Number of 64-bit words (masks' second dimension).
+
+    Returns:
+        numpy.ndarray: uint64 array of length num_words; bit (v - 1) holds the
+                       truth value of variable v.
+    """
+    padded = np.zeros(num_words * 64, dtype=np.uint8)
+    used = min(assignment_values.size - 1, padded.size)
+    padded[:used] = assignment_values[1:used + 1]
+    return np.packbits(padded, bitorder='little').view(np.uint64)
+
+def clause_satisfaction_flags(pos_mask, neg_mask, assignment_bits):
+    """
+    Computes which clauses are satisfied, for all clauses at once.
+
+    A clause is satisfied iff (pos & assignment) | (neg & ~assignment) has any
+    bit set: some positive literal is true or some negative literal's variable
+    is false. Two vectorized bitwise passes replace the per-literal Python loop.
+
+    Args:
+        pos_mask (numpy.ndarray): Positive-literal masks from build_clause_masks.
+        neg_mask (numpy.ndarray): Negative-literal masks from build_clause_masks.
+        assignment_bits (numpy.ndarray): Packed assignment from assignment_to_bits.
+
+    Returns:
+        numpy.ndarray: Boolean array of length num_clauses.
+    """
+    true_words = (pos_mask & assignment_bits) | (neg_mask & ~assignment_bits)
+    return true_words.any(axis=1)
+
+def count_satisfied_clauses(pos_mask, neg_mask, assignment_bits):
     """
     Counts the number of clauses satisfied by the current assignment.
 
     Args:
-        clauses (list of lists): All clauses in the SAT problem.
-        assignment (dict): Current variable assignment.
+        pos_mask (numpy.ndarray): Positive-literal masks from build_clause_masks.
+        neg_mask (numpy.ndarray): Negative-literal masks from build_clause_masks.
+        assignment_bits (numpy.ndarray): Packed assignment from assignment_to_bits.
 
     Returns:
         int: The total count of satisfied clauses.
     """
-    count = 0
-    for clause in clauses:
-        if is_clause_satisfied(clause, assignment):
-            count += 1
-    return count
+    return int(np.count_nonzero(clause_satisfaction_flags(pos_mask, neg_mask, assignment_bits)))
 
-def get_literal_satisfaction_counts(clauses, assignment):
+def get_literal_satisfaction_counts(pos_mask, neg_mask, assignment_bits):
     """
     Calculates for each clause how many of its literals are true under the current assignment.
     This is crucial for the "multiset" logic to determine if a clause is redundantly satisfied.
 
+    The count is the popcount of the clause's true-literal bitset: one POPCNT
+    instruction per 64-bit word via numpy's bitwise_count ufunc (a 16-bit
+    lookup table on numpy builds that predate it), instead of iterating the
+    literals in Python.
+
     Args:
-        clauses (list of lists): All clauses.
-        assignment (dict): Current variable assignment.
+        pos_mask (numpy.ndarray): Positive-literal masks from build_clause_masks.
+        neg_mask (numpy.ndarray): Negative-literal masks from build_clause_masks.
+        assignment_bits (numpy.ndarray): Packed assignment from assignment_to_bits.
 
     Returns:
-        Counter: A Counter where keys are clause indices and values are the
-                 number of true literals in that clause.
+        numpy.ndarray: Integer array where entry i is the number of true
+                       literals in clause i (indexable like the old Counter).
     """
-    literal_counts = Counter()
-    for i, clause in enumerate(clauses):
-        for literal in clause:
-            var = abs(literal)
-            if var in assignment:
-                # If the literal is true under the current assignment
-                if (literal > 0 and assignment[var]) or \
-                   (literal < 0 and not assignment[var]):
-                    literal_counts[i] += 1
-    return literal_counts
+    true_words = (pos_mask & assignment_bits) | (neg_mask & ~assignment_bits)
+    if _HAVE_BITWISE_COUNT:
+        return np.bitwise_count(true_words).sum(axis=1, dtype=np.int64)
+    halfwords = np.ascontiguousarray(true_words).view(np.uint16)
+    return _POPCOUNT16[halfwords].sum(axis=1, dtype=np.int64)
+
+def build_occurrence_csr(clause_array, highest_var):
+    """
+    Builds per-variable clause occurrence lists in compressed (CSR) form.
+
+    For each variable v, pos_items[pos_starts[v]:pos_starts[v + 1]] are the
+    indices of clauses containing the literal +v, and the neg arrays likewise
+    for -v. Flat int32 arrays keep the structure usable from jitted code.
+
+    Args:
+        clause_array (numpy.ndarray): Padded clause rows from parse_dimacs.
+        highest_var (int): The largest variable id appearing in the clauses.
+
+    Returns:
+        tuple: (pos_starts, pos_items, neg_starts, neg_items) int32 arrays.
+    """
+    flat = clause_array.ravel()
+    clause_ids = np.repeat(np.arange(clause_array.shape[0], dtype=np.int32),
+                           clause_array.shape[1])
+    pos_counts = np.bincount(np.where(flat > 0, flat, 0), minlength=highest_var + 2)
+    neg_counts = np.bincount(np.where(flat < 0, -flat, 0), minlength=highest_var + 2)
+    pos_counts[0] = 0
+    neg_counts[0] = 0
+
+    pos_starts = np.zeros(highest_var + 2, dtype=np.int32)
+    neg_starts = np.zeros(highest_var + 2, dtype=np.int32)
+    np.cumsum(pos_counts[:-1], out=pos_starts[1:])
+    np.cumsum(neg_counts[:-1], out=neg_starts[1:])
+
+    pos_order = np.argsort(np.where(flat > 0, flat, highest_var + 1), kind='stable')
+    neg_order = np.argsort(np.where(flat < 0, -flat, highest_var + 1), kind='stable')
+    pos_items = clause_ids[pos_order[:pos_starts[-1]]].astype(np.int32)
+    neg_items = clause_ids[neg_order[:neg_starts[-1]]].astype(np.int32)
+    return pos_starts, pos_items, neg_starts, neg_items
+
+def unit_propagate(clauses, highest_var):
+    """
+    Propagates unit clauses to a fixpoint before any search begins.
+
+    A clause with a single unassigned literal (and no true literal) forces
+    that literal's value; each forced assignment can in turn strip other
+    clauses down to a new unit, so forcing proceeds transitively. Clause state
+    is tracked with the two-watched-literals scheme: every clause watches two
+    of its non-false literals, and a clause is only re-examined when one of
+    its two watched literals becomes false - not on every assignment to any
+    of its variables. On random 3-SAT this is a no-op, but on structured
+    instances it can fix most variables in one linear pass.
+
+    Args:
+        clauses (numpy.ndarray): Padded clause rows from parse_dimacs.
+        highest_var (int): The largest variable id appearing in the clauses.
 
+    Returns:
+        tuple: (forced_values, conflict), where forced_values is an int8 array
+               indexed by variable id holding 0/1 for forced variables and -1
+               for free ones, and conflict is True when propagation emptied a
+               clause (the formula is unsatisfiable as given).
+    """
+    n_clauses = clauses.shape[0]
+    width = clauses.shape[1]
+    forced_values = np.full(highest_var + 1, -1, dtype=np.int8)
+
+    def literal_value(literal):
+        """-1 if the literal's variable is unassigned, else 0/1 truth value."""
+        value = forced_values[abs(literal)]
+        if value == -1:
+            return -1
+        return int(value) if literal > 0 else 1 - int(value)
+
+    # watch_slots[i] holds the two watched literal positions of clause i;
+    # watch_lists maps a literal to the clauses currently watching it.
+    watch_slots = np.full((n_clauses, 2), -1, dtype=np.int32)
+    watch_lists = {}
+    pending = []
+
+    for i in range(n_clauses):
+        slots = [j for j in range(width) if clauses[i, j] != 0]
+        if not slots:
+            continue
+        if len(slots) == 1: # Already a unit clause in the input
+            pending.append(int(clauses[i, slots[0]]))
+            continue
+        watch_slots[i, 0] = slots[0]
+        watch_slots[i, 1] = slots[1]
+        watch_lists.setdefault(int(clauses[i, slots[0]]), []).append(i)
+        watch_lists.setdefault(int(clauses[i, slots[1]]), []).append(i)
+
+    head = 0
+    while head < len(pending):
+        unit_literal = pending[head]
+        head += 1
+        var = abs(unit_literal)
+        value = 1 if unit_literal > 0 else 0
+        if forced_values[var] != -1:
+            if int(forced_values[var]) != value: # Both polarities forced
+                return forced_values, True
+            continue
+        forced_values[var] = value
+
+        # Only the clauses watching the falsified literal need a look.
+        falsified = -unit_literal
+        watchers = watch_lists.pop(falsified, [])
+        still_watching = []
+        for i in watchers:
+            if int(clauses[i, watch_slots[i, 0]]) == falsified:
+                falsified_pos, other_pos = 0, 1
+            else:
+                falsified_pos, other_pos = 1, 0
+            other_literal = int(clauses[i, watch_slots[i, other_pos]])
+
+            if literal_value(other_literal) == 1:
+                # Clause already satisfied through its other watch.
+                still_watching.append(i)
+                continue
+
+            # Try to move the watch to another non-false literal.
+            replacement_slot = -1
+            for j in range(width):
+                literal = int(clauses[i, j])
+                if literal == 0 or j == watch_slots[i, other_pos]:
+                    continue
+                if literal_value(literal) != 0:
+                    replacement_slot = j
+                    break
+            if replacement_slot != -1:
+                watch_slots[i, falsified_pos] = replacement_slot
+                watch_lists.setdefault(int(clauses[i, replacement_slot]), []).append(i)
+                continue
+
+            # No replacement: the other watched literal is unit (or conflict).
+            still_watching.append(i)
+            other_value = literal_value(other_literal)
+            if other_value == 0:
+                watch_lists[falsified] = still_watching + watchers[watchers.index(i) + 1:]
+                return forced_values, True
+            if other_value == -1:
+                pending.append(other_literal)
+        if still_watching:
+            watch_lists[falsified] = still_watching
+
+    return forced_values, False
+
+@_maybe_njit
+def _clause_true_literal_count(clause_array, clause_idx, assignment_array):
+    """Number of true literals in one clause under a 0/1 assignment array."""
+    count = 0
+    for j in range(clause_array.shape[1]):
+        literal = clause_array[clause_idx, j]
+        if literal == 0:
+            continue
+        # Branchless: the literal is true iff the assigned bit differs from
+        # the literal's sign bit, so XOR evaluates it without a compare chain.
+        count += np.int32(assignment_array[abs(literal)]) ^ np.int32(literal < 0)
+    return count
 
-def solve_3sat(file_path):
+@_maybe_njit
+def _flip_deltas(var_to_flip, original_val, true_counts,
+                 pos_starts, pos_items, neg_starts, neg_items):
+    """
+    Make/break bookkeeping for flipping one variable, from its occurrence lists.
+
+    Returns (net_gain, break_count): break_count is the number of clauses whose
+    single true literal the flip would falsify, and net_gain is the number of
+    newly satisfied clauses minus break_count.
+    """
+    if original_val == 1:
+        break_starts, break_items = pos_starts, pos_items
+        make_starts, make_items = neg_starts, neg_items
+    else:
+        break_starts, break_items = neg_starts, neg_items
+        make_starts, make_items = pos_starts, pos_items
+
+    break_count = 0
+    for p in range(break_starts[var_to_flip], break_starts[var_to_flip + 1]):
+        if true_counts[break_items[p]] == 1:
+            break_count += 1
+    make_count = 0
+    for p in range(make_starts[var_to_flip], make_starts[var_to_flip + 1]):
+        if true_counts[make_items[p]] == 0:
+            make_count += 1
+    return make_count - break_count, break_count
+
+@_maybe_njit
+def _local_search(clause_array, assignment_array, max_flips, noise, stall_limit,
+                  pos_starts, pos_items, neg_starts, neg_items, flips_out):
+    """
+    GSAT/WalkSAT-style second pass over the flat clause store, compiled with numba.
+
+    Repeatedly picks a random unsatisfied clause. With probability `noise` a
+    uniformly random literal of that clause is flipped unconditionally
+    (WalkSAT-style escape from local optima); otherwise the literal with the
+    best net gain is flipped, breaking ties by the "multiset" cost (clauses
+    whose single true literal would be lost). Per-clause true-literal counts
+    are maintained incrementally, so scoring a flip of v only touches the
+    clauses containing v. The pass gives up early when the satisfied count has
+    not improved for stall_limit consecutive iterations, letting the caller
+    restart from a fresh random assignment. Committed flips are recorded in
+    flips_out as (variable, value, net_gain) rows; assignment_array is updated
+    in place.
+
+    Args:
+        clause_array (numpy.ndarray): Padded clause rows from parse_dimacs.
+        assignment_array (numpy.ndarray): uint8 truth values indexed by variable id.
+        max_flips (int): Maximum number of flip iterations.
+        noise (float): Probability of taking a random-walk flip instead of the
+                       greedy one.
+        stall_limit (int): Iterations without improvement before giving up.
+        pos_starts, pos_items, neg_starts, neg_items (numpy.ndarray):
+            Per-variable clause occurrence lists from build_occurrence_csr.
+        flips_out (numpy.ndarray): Preallocated int32 array of shape (max_flips, 3).
+
+    Returns:
+        tuple: (final_satisfied_count, number_of_committed_flips).
+    """
+    n_clauses = clause_array.shape[0]
+    width = clause_array.shape[1]
+    n_flips = 0
+
+    # Unsatisfied clauses live in the first n_unsatisfied slots of
+    # `unsatisfied`; unsat_positions maps a clause index back to its slot so a
+    # clause can be removed in O(1) by swapping the last element into its slot.
+    true_counts = np.zeros(n_clauses, dtype=np.int32)
+    unsatisfied = np.empty(n_clauses, dtype=np.int32)
+    unsat_positions = np.full(n_clauses, -1, dtype=np.int32)
+    n_unsatisfied = 0
+    for i in range(n_clauses):
+        true_counts[i] = _clause_true_literal_count(clause_array, i, assignment_array)
+        if true_counts[i] == 0:
+            unsat_positions[i] = n_unsatisfied
+            unsatisfied[n_unsatisfied] = i
+            n_unsatisfied += 1
+
+    # The satisfied count is always read as n_clauses - n_unsatisfied: the
+    # unsat list is maintained exactly, whereas summing _flip_deltas net gains
+    # drifts on tautological clauses (containing both +v and -v), whose break
+    # scan counts a clause the flip actually leaves satisfied.
+    best_seen_satisfied = n_clauses - n_unsatisfied
+    since_improvement = 0
+
+    for _ in range(max_flips):
+        if n_unsatisfied == 0:
+            break
+
+        target_clause_idx = unsatisfied[np.random.randint(n_unsatisfied)]
+
+        best_flip_var = -1
+        best_flip_val = np.uint8(0)
+        best_net_gain = -(1 << 30)
+        commit_flip = False
+
+        if np.random.random() < noise:
+            # Random-walk move: flip a uniformly chosen literal of the target
+            # clause regardless of its score, to escape local optima.
+            n_valid = 0
+            for j in range(width):
+                if clause_array[target_clause_idx, j] != 0:
+                    n_valid += 1
+            pick = np.random.randint(n_valid)
+            for j in range(width):
+                literal = clause_array[target_clause_idx, j]
+                if literal == 0:
+                    continue
+                if pick == 0:
+                    best_flip_var = abs(literal)
+                    best_flip_val = np.uint8(literal > 0)
+                    break
+                pick -= 1
+            best_net_gain, _unused = _flip_deltas(best_flip_var,
+                                                  assignment_array[best_flip_var],
+                                                  true_counts, pos_starts, pos_items,
+                                                  neg_starts, neg_items)
+            commit_flip = True
+        else:
+            best_multiset_cost = 1 << 30
+            for j in range(width):
+                literal = clause_array[target_clause_idx, j]
+                if literal == 0:
+                    continue
+                var_to_flip = abs(literal)
+                hypothetical_val = np.uint8(literal > 0)
+
+                # Clauses whose current support is the literal being falsified
+                # (true_counts == 1) break; clauses that were unsatisfied and
+                # contain the newly-true literal are made. Only occurrences of
+                # var_to_flip need to be inspected. The "multiset" cost is
+                # exactly the break count.
+                net_gain, multiset_cost = _flip_deltas(var_to_flip,
+                                                       assignment_array[var_to_flip],
+                                                       true_counts, pos_starts, pos_items,
+                                                       neg_starts, neg_items)
+
+                if net_gain > best_net_gain or \
+                   (net_gain == best_net_gain and multiset_cost < best_multiset_cost):
+                    best_net_gain = net_gain
+                    best_flip_var = var_to_flip
+                    best_flip_val = hypothetical_val
+                    best_multiset_cost = multiset_cost
+
+            # The chosen flip always satisfies the target clause (it makes one
+            # of the clause's own literals true), so zero-gain flips are
+            # accepted too.
+            commit_flip = best_flip_var != -1 and best_net_gain >= 0
+
+        if commit_flip:
+            assignment_array[best_flip_var] = best_flip_val
+            if best_flip_val == 1:
+                gain_starts, gain_items = pos_starts, pos_items
+                lose_starts, lose_items = neg_starts, neg_items
+            else:
+                gain_starts, gain_items = neg_starts, neg_items
+                lose_starts, lose_items = pos_starts, pos_items
+
+            for p in range(gain_starts[best_flip_var], gain_starts[best_flip_var + 1]):
+                clause_idx = gain_items[p]
+                true_counts[clause_idx] += 1
+                if true_counts[clause_idx] == 1:
+                    # Clause became satisfied: swap-remove it from the unsat list.
+                    slot = unsat_positions[clause_idx]
+                    last_clause = unsatisfied[n_unsatisfied - 1]
+                    unsatisfied[slot] = last_clause
+                    unsat_positions[last_clause] = slot
+                    unsat_positions[clause_idx] = -1
+                    n_unsatisfied -= 1
+            for p in range(lose_starts[best_flip_var], lose_starts[best_flip_var + 1]):
+                clause_idx = lose_items[p]
+                true_counts[clause_idx] -= 1
+                if true_counts[clause_idx] == 0:
+                    # Clause lost its last true literal: append to the unsat list.
+                    unsat_positions[clause_idx] = n_unsatisfied
+                    unsatisfied[n_unsatisfied] = clause_idx
+                    n_unsatisfied += 1
+            flips_out[n_flips, 0] = best_flip_var
+            flips_out[n_flips, 1] = best_flip_val
+            flips_out[n_flips, 2] = best_net_gain
+            n_flips += 1
+
+        if n_clauses - n_unsatisfied > best_seen_satisfied:
+            best_seen_satisfied = n_clauses - n_unsatisfied
+            since_improvement = 0
+        else:
+            since_improvement += 1
+            if since_improvement >= stall_limit:
+                break
+
+    return n_clauses - n_unsatisfied, n_flips
+
+
+def solve_3sat(file_path, record_steps=True):
     """
     Solves a 3-SAT problem using a two-pass strategy:
     1. A greedy first pass to make initial assignments.
@@ -114,6 +625,8 @@ def solve_3sat(file_path):
 
     Args:
         file_path (str): The path to the DIMACS CNF file.
+        record_steps (bool): When False, skips building the human-readable step
+                             log (the returned steps list stays empty).
 
     Returns:
         tuple: (is_satisfiable, assignment, satisfied_count, steps), where
@@ -124,127 +637,280 @@ def solve_3sat(file_path):
     """
     num_variables, clauses = parse_dimacs(file_path)
 
-    if not clauses:
+    if len(clauses) == 0:
         # print("No clauses found or error parsing file. Returning.") # Suppress for automated testing
         return False, {}, 0, []
 
     # --- First Pass: Greedy Heuristic ---
-    variable_occurrence_map = defaultdict(set)
-    for i, clause in enumerate(clauses):
-        for literal in clause:
-            variable_occurrence_map[literal].add(i)
-
-    set_variables = {}
+    # One pass over the flat literal array yields per-variable occurrence
+    # counts; no per-literal set insertion or sort-key lambda is needed.
+    flat_literals = clauses.ravel()
+    highest_var = max(num_variables, int(np.abs(flat_literals).max()))
+    pos_counts = np.bincount(np.where(flat_literals > 0, flat_literals, 0),
+                             minlength=highest_var + 1)
+    neg_counts = np.bincount(np.where(flat_literals < 0, -flat_literals, 0),
+                             minlength=highest_var + 1)
+    pos_counts[0] = 0 # Bucket 0 collected the padding sentinels
+    neg_counts[0] = 0
+    total_counts = pos_counts + neg_counts
+
+    # Flat 0/1 truth values indexed by variable id: a raw byte load per lookup
+    # instead of a dict hash, and directly usable by the jitted kernels.
+    assignment_values = np.zeros(highest_var + 1, dtype=np.uint8)
     assignment_steps = []
 
-    all_unique_vars = sorted(list(set(abs(l) for clause in clauses for l in clause)))
+    # Unit propagation fixes every variable the formula forces outright; the
+    # forced variables stay pinned through the greedy pass and all restarts.
+    forced_values, propagation_conflict = unit_propagate(clauses, highest_var)
+    if propagation_conflict:
+        # Conflicting unit chain: no satisfying assignment exists, but fall
+        # back to the plain search so the satisfied-count report still works.
+        forced_values[:] = -1
+    forced_mask = forced_values >= 0
 
-    sorted_variables_by_occurrence = sorted(all_unique_vars,
-                                            key=lambda x: len(variable_occurrence_map[x]) + len(variable_occurrence_map[-x]),
-                                            reverse=True)
+    # Stable argsort on negated counts == sort by occurrence descending,
+    # ties broken by ascending variable id as before.
+    sorted_variables_by_occurrence = np.argsort(-total_counts[1:], kind='stable') + 1
+
+    # The sign choice for every variable at once: set a variable true exactly
+    # when its positive literal occurs at least as often as its negative one.
+    chosen_positive = pos_counts >= neg_counts
 
     for var_abs in sorted_variables_by_occurrence:
-        if var_abs in set_variables:
+        var_abs = int(var_abs)
+        if total_counts[var_abs] == 0: # Variable never occurs in a clause
             continue
 
-        pos_size = len(variable_occurrence_map[var_abs])
-        neg_size = len(variable_occurrence_map[-var_abs])
+        if forced_mask[var_abs]:
+            value = bool(forced_values[var_abs])
+            assignment_values[var_abs] = value
+            if record_steps:
+                assignment_steps.append((var_abs, value,
+                                         f"Forced {var_abs} to {value} by unit propagation"))
+            continue
 
-        chosen_literal = 0
-        reason = ""
+        value = bool(chosen_positive[var_abs])
+        assignment_values[var_abs] = value
 
-        if pos_size >= neg_size:
-            chosen_literal = var_abs
-            reason = f"Chose {var_abs} (positive) because it appears in {pos_size} clauses vs {-var_abs} in {neg_size} clauses"
+        if record_steps:
+            pos_size = int(pos_counts[var_abs])
+            neg_size = int(neg_counts[var_abs])
+            if value:
+                reason = f"Chose {var_abs} (positive) because it appears in {pos_size} clauses vs {-var_abs} in {neg_size} clauses"
+            else:
+                reason = f"Chose {-var_abs} (negative) because it appears in {neg_size} clauses vs {var_abs} in {pos_size} clauses"
+            assignment_steps.append((var_abs, value, reason))
+
+    # --- Second Pass: Local Search (WalkSAT-like with user's "multiset" preference) ---
+    second_pass_steps = []
+    max_flips = num_variables * 5 if num_variables > 0 else 50 # Default to 50 flips if num_variables is 0
+    stall_limit = max(20, num_variables * 2)
+    occurring_vars = np.flatnonzero(total_counts)
+    # Restarts only reseed the variables unit propagation left free.
+    free_vars = occurring_vars[~forced_mask[occurring_vars]]
+
+    # Both search paths score flips from the per-literal occurrence lists.
+    pos_starts, pos_items, neg_starts, neg_items = build_occurrence_csr(clauses,
+                                                                        highest_var)
+    if NUMBA_AVAILABLE:
+        # Jitted path: the whole flip loop runs compiled over the flat clause
+        # array, mutating the uint8 assignment in place.
+        flips_out = np.empty((max_flips, 3), dtype=np.int32)
+    else:
+        # Pure-Python fallback: vectorized bitmask scan, used when numba is missing.
+        pos_mask, neg_mask = build_clause_masks(clauses, num_variables)
+
+    best_values = assignment_values.copy()
+    final_satisfied_count = -1
+
+    for restart in range(NUM_RESTARTS):
+        if restart > 0:
+            # The previous pass stalled (or ran out of flips) short of a
+            # solution: restart the search from a fresh random assignment.
+            assignment_values[free_vars] = \
+                np.random.randint(0, 2, free_vars.size).astype(np.uint8)
+            if record_steps:
+                second_pass_steps.append((0, False,
+                                          f"Restart {restart}: reseeded the assignment randomly"))
+
+        if NUMBA_AVAILABLE:
+            restart_count, n_flips = _local_search(clauses, assignment_values, max_flips,
+                                                   NOISE_PROBABILITY, stall_limit,
+                                                   pos_starts, pos_items,
+                                                   neg_starts, neg_items, flips_out)
+            if record_steps:
+                for k in range(n_flips):
+                    flip_var = int(flips_out[k, 0])
+                    flip_val = bool(flips_out[k, 1])
+                    second_pass_steps.append((flip_var, flip_val,
+                                              f"Flipped {flip_var} to {flip_val} "
+                                              f"(net gain: {int(flips_out[k, 2])})"))
         else:
-            chosen_literal = -var_abs
-            reason = f"Chose {-var_abs} (negative) because it appears in {neg_size} clauses vs {var_abs} in {pos_size} clauses"
+            restart_count, restart_steps = _local_search_bitmask(clauses, pos_mask, neg_mask,
+                                                                 assignment_values, max_flips,
+                                                                 NOISE_PROBABILITY, stall_limit,
+                                                                 pos_starts, pos_items,
+                                                                 neg_starts, neg_items,
+                                                                 record_steps)
+            second_pass_steps.extend(restart_steps)
+
+        if restart_count > final_satisfied_count:
+            final_satisfied_count = restart_count
+            best_values = assignment_values.copy()
+        if final_satisfied_count == len(clauses):
+            break
+
+    assignment_values = best_values
+
+    if final_satisfied_count == len(clauses):
+        final_assignment = {int(v): bool(assignment_values[v])
+                            for v in occurring_vars}
+        return True, final_assignment, len(clauses), assignment_steps + second_pass_steps
+    else:
+        return False, None, final_satisfied_count, assignment_steps + second_pass_steps
 
-        set_variables[var_abs] = (chosen_literal > 0)
-        assignment_steps.append((var_abs, chosen_literal > 0, reason))
+def _local_search_bitmask(clauses, pos_mask, neg_mask, assignment_values,
+                          max_flips, noise, stall_limit,
+                          pos_starts, pos_items, neg_starts, neg_items,
+                          record_steps):
+    """
+    Bitmask-based local search pass, used when numba is not installed.
 
-    best_assignment = {var: val for var, val in set_variables.items()}
-    max_satisfied_count = count_satisfied_clauses(clauses, best_assignment)
+    Same WalkSAT-style policy as the jitted _local_search: with probability
+    `noise` flip a random literal of the chosen unsatisfied clause, otherwise
+    flip the best-scoring one, and give up after stall_limit iterations
+    without improvement so the caller can restart. assignment_values is
+    mutated in place.
 
-    # --- Second Pass: Local Search (GSAT-like with user's "multiset" preference) ---
+    Args:
+        clauses (numpy.ndarray): Padded clause rows from parse_dimacs.
+        pos_mask, neg_mask (numpy.ndarray): Clause bitmasks from build_clause_masks.
+        assignment_values (numpy.ndarray): uint8 truth values indexed by variable id.
+        max_flips (int): Maximum number of flip iterations.
+        noise (float): Probability of taking a random-walk flip.
+        stall_limit (int): Iterations without improvement before giving up.
+        pos_starts, pos_items, neg_starts, neg_items (numpy.ndarray):
+            Per-literal occurrence lists from build_occurrence_csr.
+        record_steps (bool): Whether to build the human-readable step log.
+
+    Returns:
+        tuple: (final_satisfied_count, steps), steps being a list of
+               (variable, value, reason) tuples for committed flips.
+    """
     second_pass_steps = []
-    max_flips = num_variables * 5 if num_variables > 0 else 50 # Default to 50 flips if num_variables is 0
+    assignment_bits = assignment_to_bits(assignment_values, pos_mask.shape[1])
+    max_satisfied_count = count_satisfied_clauses(pos_mask, neg_mask, assignment_bits)
+    best_seen_satisfied = max_satisfied_count
+    since_improvement = 0
 
     for flip_count in range(max_flips):
-        unsatisfied_clause_indices = [i for i, clause in enumerate(clauses)
-                                      if not is_clause_satisfied(clause, best_assignment)]
+        satisfied_flags = clause_satisfaction_flags(pos_mask, neg_mask, assignment_bits)
+        unsatisfied_clause_indices = np.flatnonzero(~satisfied_flags)
 
-        if not unsatisfied_clause_indices:
+        if unsatisfied_clause_indices.size == 0:
             break
 
-        target_clause_idx = random.choice(unsatisfied_clause_indices)
+        target_clause_idx = int(random.choice(unsatisfied_clause_indices))
         target_clause = clauses[target_clause_idx]
 
-        best_flip_var_candidate = None
-        best_flip_val_candidate = None
-        best_candidate_net_gain = -float('inf')
-        best_candidate_multiset_cost = float('inf')
-
-        literal_satisfaction_counts = get_literal_satisfaction_counts(clauses, best_assignment)
-
-        for literal_in_clause in target_clause:
-            var_to_flip_abs = abs(literal_in_clause)
-            hypothetical_val_for_literal = (literal_in_clause > 0)
-
-            temp_assignment = best_assignment.copy()
-            temp_assignment[var_to_flip_abs] = hypothetical_val_for_literal
-
-            new_satisfied_count = count_satisfied_clauses(clauses, temp_assignment)
-            net_gain = new_satisfied_count - max_satisfied_count
-
-            current_flip_multiset_cost = 0
-            original_val_of_var = best_assignment.get(var_to_flip_abs)
-            literal_that_was_true_before_flip = None
-            if original_val_of_var is not None:
-                literal_that_was_true_before_flip = var_to_flip_abs if original_val_of_var else -var_to_flip_abs
-
-            for i, c in enumerate(clauses):
-                if is_clause_satisfied(c, best_assignment) and not is_clause_satisfied(c, temp_assignment):
-                    if literal_that_was_true_before_flip in c and literal_satisfaction_counts[i] == 1:
-                        current_flip_multiset_cost += 1
-
-            if net_gain > best_candidate_net_gain:
-                best_candidate_net_gain = net_gain
-                best_flip_var_candidate = var_to_flip_abs
-                best_flip_val_candidate = hypothetical_val_for_literal
-                best_candidate_multiset_cost = current_flip_multiset_cost
-            elif net_gain == best_candidate_net_gain:
-                if current_flip_multiset_cost < best_candidate_multiset_cost:
-                    best_candidate_net_gain = net_gain
-                    best_flip_var_candidate = var_to_flip_abs
-                    best_flip_val_candidate = hypothetical_val_for_literal
-                    best_candidate_multiset_cost = current_flip_multiset_cost
-
-        if best_flip_var_candidate is not None:
-            if best_candidate_net_gain > 0 or \
-               (best_candidate_net_gain == 0 and not is_clause_satisfied(target_clause, best_assignment) and
-                is_clause_satisfied(target_clause, {**best_assignment, best_flip_var_candidate: best_flip_val_candidate})):
-
-                best_assignment[best_flip_var_candidate] = best_flip_val_candidate
-                max_satisfied_count = count_satisfied_clauses(clauses, best_assignment)
-
-                second_pass_steps.append((best_flip_var_candidate, best_flip_val_candidate,
-                                          f"Flipped {best_flip_var_candidate} to {best_flip_val_candidate} "
-                                          f"to target clause {target_clause_idx} (net gain: {best_candidate_net_gain}, "
-                                          f"multiset cost: {best_candidate_multiset_cost})"))
-
-    final_satisfied_count = count_satisfied_clauses(clauses, best_assignment)
+        valid_literals = [int(literal) for literal in target_clause if literal != 0]
+        if not valid_literals:
+            continue
 
-    if final_satisfied_count == len(clauses):
-        return True, best_assignment, len(clauses), assignment_steps + second_pass_steps
-    else:
-        return False, None, final_satisfied_count, assignment_steps + second_pass_steps
+        literal_satisfaction_counts = get_literal_satisfaction_counts(pos_mask, neg_mask, assignment_bits)
+
+        # Score each candidate straight from its occurrence lists: clauses
+        # whose only true literal is the one being falsified break, and
+        # unsatisfied clauses containing the newly-true literal are made.
+        # The index lists already guarantee the literal is in the clause, so
+        # no membership scan of the clause rows is needed, and only the
+        # occ(var) clauses are touched per candidate. Candidates are
+        # (var, value, net_gain, multiset_cost) tuples.
+        candidates = []
+        for literal in valid_literals:
+            var_to_flip_abs = abs(literal)
+            if assignment_values[var_to_flip_abs]:
+                break_starts, break_items = pos_starts, pos_items
+                make_starts, make_items = neg_starts, neg_items
+            else:
+                break_starts, break_items = neg_starts, neg_items
+                make_starts, make_items = pos_starts, pos_items
+
+            break_occurrences = break_items[break_starts[var_to_flip_abs]:
+                                            break_starts[var_to_flip_abs + 1]]
+            make_occurrences = make_items[make_starts[var_to_flip_abs]:
+                                          make_starts[var_to_flip_abs + 1]]
+            current_flip_multiset_cost = int(np.count_nonzero(
+                literal_satisfaction_counts[break_occurrences] == 1))
+            make_count = int(np.count_nonzero(
+                literal_satisfaction_counts[make_occurrences] == 0))
+
+            candidates.append((var_to_flip_abs, bool(literal > 0),
+                               make_count - current_flip_multiset_cost,
+                               current_flip_multiset_cost))
+
+        if random.random() < noise:
+            # Random-walk move: flip a uniformly chosen literal of the target
+            # clause regardless of its score, to escape local optima.
+            chosen = random.choice(candidates)
+            commit_flip = True
+        else:
+            chosen = candidates[0]
+            for candidate in candidates[1:]:
+                if candidate[2] > chosen[2] or \
+                   (candidate[2] == chosen[2] and candidate[3] < chosen[3]):
+                    chosen = candidate
+            # The chosen flip always satisfies the target clause (it makes one
+            # of the clause's own literals true), so zero-gain flips are
+            # accepted too.
+            commit_flip = chosen[2] >= 0
+
+        if commit_flip:
+            flip_var, flip_val, net_gain, multiset_cost = chosen
+            flip_word, flip_bit = divmod(flip_var - 1, 64)
+            assignment_values[flip_var] = flip_val
+            assignment_bits[flip_word] ^= np.uint64(1 << flip_bit)
+            max_satisfied_count += net_gain
+
+            if record_steps:
+                second_pass_steps.append((flip_var, flip_val,
+                                          f"Flipped {flip_var} to {flip_val} "
+                                          f"to target clause {target_clause_idx} (net gain: {net_gain}, "
+                                          f"multiset cost: {multiset_cost})"))
+
+        if max_satisfied_count > best_seen_satisfied:
+            best_seen_satisfied = max_satisfied_count
+            since_improvement = 0
+        else:
+            since_improvement += 1
+            if since_improvement >= stall_limit:
+                break
+
+    return count_satisfied_clauses(pos_mask, neg_mask, assignment_bits), second_pass_steps
+
+def _solve_one(full_file_path):
+    """
+    Solves a single instance and returns its satisfied-clause count.
+
+    Module-level so it can be pickled and shipped to worker processes.
+
+    Args:
+        full_file_path (str): Path to one DIMACS CNF file.
+
+    Returns:
+        int: The number of clauses satisfied by the final assignment.
+    """
+    _, _, satisfied_count, _ = solve_3sat(full_file_path, record_steps=False)
+    return satisfied_count
 
 def run_instances(base_path, file_prefix, start_instance, end_instance, num_digits=4):
     """
     Automates testing of 3-SAT instances within a specified range,
     handling filenames with leading zeros.
 
+    Instances are independent, so they are solved in parallel across one
+    worker process per CPU; results are printed in instance order afterwards.
+
     Args:
         base_path (str): The base directory where the DIMACS files are located.
         file_prefix (str): The common prefix for the instance filenames (e.g., "uf20-").
@@ -253,33 +919,56 @@ def run_instances(base_path, file_prefix, start_instance, end_instance, num_digi
         num_digits (int): The number of digits for padding the instance number
                           in the filename (e.g., 4 for '0101').
     """
-    print("--- Satisfied Clauses Per Instance ---")
+    file_paths = []
     for i in range(start_instance, end_instance + 1):
         # Format the instance number with leading zeros
         padded_instance_num = f"{i:0{num_digits}d}"
         file_name = f"{file_prefix}{padded_instance_num}.cnf" # Assuming .cnf extension
-        full_file_path = os.path.join(base_path, file_name)
+        file_paths.append(os.path.join(base_path, file_name))
 
-        # Call the solver and only extract the satisfied_count
-        _, _, satisfied_count, _ = solve_3sat(full_file_path)
-        print(satisfied_count)
+    print("--- Satisfied Clauses Per Instance ---")
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for satisfied_count in executor.map(_solve_one, file_paths, chunksize=4):
+            print(satisfied_count)
 
-# === Example Usage ===
-# IMPORTANT:
-# 1. Replace "Path" with the actual base directory where your DIMACS files are stored.
-#    For example, if your files are in 'C:\Users\YourUser\Documents\Research on uf20\uf20-0101.cnf',
-#    then base_path should be r"C:\Users\YourUser\Documents\Research on uf20"
-# 2. Ensure your files are named consistently, like uf20-0101.cnf, uf20-0102.cnf, etc.
+def _parse_args():
+    """
+    Parses the command-line options for the example-usage run below.
+
+    The defaults reproduce the values that used to be hardcoded here, so
+    running the script with no arguments behaves as before.
 
-# start_time_overall = time.time() # You can uncomment this to measure overall runtime if needed
+    Returns:
+        argparse.Namespace: The parsed options.
+    """
+    parser = argparse.ArgumentParser(
+        description="Run the 3-SAT solver over a range of DIMACS CNF instances.")
+    parser.add_argument("--base-path", default=r"C:\Users\Vedaang\Desktop\Research on uf20",
+                        help="Base directory where the DIMACS files are stored.")
+    parser.add_argument("--file-prefix", default="uf20-",
+                        help="Common prefix of the instance filenames (e.g. 'uf20-').")
+    parser.add_argument("--start-instance", type=int, default=1,
+                        help="First instance number (inclusive).")
+    parser.add_argument("--end-instance", type=int, default=9,
+                        help="Last instance number (inclusive).")
+    parser.add_argument("--num-digits", type=int, default=2,
+                        help="Number of digits the instance number is padded to in "
+                             "the filename (e.g. 4 for 'uf20-0101.cnf').")
+    return parser.parse_args()
+
+# === Example Usage ===
+#   python Latest_Research.py --base-path "Research on uf20" --file-prefix uf20- \
+#       --start-instance 1 --end-instance 9 --num-digits 2
+# Ensure your files are named consistently, like uf20-0101.cnf, uf20-0102.cnf, etc.
 
-base_path = r"C:\Users\Vedaang\Desktop\Research on uf20" # <--- REPLACE THIS WITH YOUR ACTUAL BASE PATH
-file_prefix = "uf20-"
-start_instance = 1 # Start at 101 if your files are uf20-0101.cnf
-end_instance = 9   # End at 101 for a single file test
-num_digits_in_filename = 2 # <--- IMPORTANT: Set this to match the number of digits in your filenames (e.g., 4 for '0101')
+if __name__ == "__main__":
+    # Guarded so importing this module (from tests, or by ProcessPoolExecutor
+    # workers on spawn-based platforms) does not kick off a solver run.
+    args = _parse_args()
 
-run_instances(base_path, file_prefix, start_instance, end_instance, num_digits=num_digits_in_filename)
+    run_instances(args.base_path, args.file_prefix,
+                  args.start_instance, args.end_instance,
+                  num_digits=args.num_digits)
 
-end_time_overall = time.time()
-print(f"\nOverall Runtime for instances {start_instance}-{end_instance}: {end_time_overall - start:.2f} seconds")
+    end_time_overall = time.time()
+    print(f"\nOverall Runtime for instances {args.start_instance}-{args.end_instance}: {end_time_overall - start:.2f} seconds")
@@ -1,3 +1,4 @@
+import argparse
 from collections import defaultdict, Counter
 import time
 
@@ -5,7 +6,7 @@ start = time.time()
 
 def parse_dimacs(file_path):
     clauses = []
-    with open(file_path, 'r') as file:
+    with open(file_path, 'r', buffering=1 << 20) as file:
         for line in file:
             if line.startswith('c') or line.startswith('%') or line.startswith('0') or line.strip() == '':
                 continue
@@ -59,27 +60,37 @@ def solve_3sat(file_path):
 
     if len(satisfied_clauses) == len(clauses):
         assignment = {var: value for var, value in set_variables.items()}
-        return True, assignment, len(clauses), assignment_steps
+        return True, assignment, len(clauses), len(clauses), assignment_steps
 
     satisfied_count = sum(1 for count in satisfied_clauses.values() if count > 0)
-    return False, None, satisfied_count, assignment_steps
+    return False, None, satisfied_count, len(clauses), assignment_steps
 
 # === Example Usage ===
-file_path = r"C:\Users\Vedaang\Desktop\Research on uf20\industry-2.cnf"  # Replace with actual path
-result, assignment, satisfied_count, steps = solve_3sat(file_path)
-
-end = time.time()
-
-print("\n--- Variable Assignment Steps ---")
-for var, val, reason in steps:
-    print(f"Variable {var} set to {val} → {reason}")
-
-print("\n--- Final Result ---")
-if result:
-    print("SATISFIABLE")
-    print("Assignment:", assignment)
-else:
-    print("UNSATISFIABLE")
-    print(f"Number of satisfied clauses: {satisfied_count} out of {len(parse_dimacs(file_path)[1])}")
-
-print(f"Runtime: {end - start:.2f} seconds")
+#   python Research4.py --file-path industry-2.cnf
+if __name__ == "__main__":
+    # Guarded so importing this module does not kick off a solver run.
+    parser = argparse.ArgumentParser(
+        description="Run the greedy 3-SAT heuristic on one DIMACS CNF instance.")
+    parser.add_argument("--file-path",
+                        default=r"C:\Users\Vedaang\Desktop\Research on uf20\industry-2.cnf",
+                        help="Path to the DIMACS CNF file to solve.")
+    args = parser.parse_args()
+
+    result, assignment, satisfied_count, num_clauses, steps = solve_3sat(args.file_path)
+
+    end = time.time()
+
+    print("\n--- Variable Assignment Steps ---")
+    for var, val, reason in steps:
+        print(f"Variable {var} set to {val} → {reason}")
+
+    print("\n--- Final Result ---")
+    if result:
+        print("SATISFIABLE")
+        print("Assignment:", assignment)
+    else:
+        print("UNSATISFIABLE")
+        # num_clauses comes back from solve_3sat, so the file is not parsed a second time
+        print(f"Number of satisfied clauses: {satisfied_count} out of {num_clauses}")
+
+    print(f"Runtime: {end - start:.2f} seconds")